@@ -1,5 +1,6 @@
 import argparse
 import math
+from concurrent.futures import ProcessPoolExecutor
 from sys import version_info
 
 import meshio
@@ -40,6 +41,7 @@ def _get_parser():
             #
             "odt-fixed-point",
             "odt-bfgs",
+            "odt-l-bfgs-b",
         ],
         default="cvt-full",
         help="smoothing method (default: cvt-full)",
@@ -124,7 +126,9 @@ def _get_parser():
 
 
 def prune(mesh):
-    ncells = np.concatenate([np.concatenate(data) for _, data in mesh.cells])
+    # Flatten each cell block with a reshape (free) rather than concatenating its
+    # rows one by one; only the blocks themselves need an actual concatenation.
+    ncells = np.concatenate([data.reshape(-1) for _, data in mesh.cells])
     uvertices, uidx = np.unique(ncells, return_inverse=True)
     k = 0
     for _, data in mesh.cells:
@@ -136,6 +140,20 @@ def prune(mesh):
         mesh.point_data[key] = mesh.point_data[key][uvertices]
 
 
+def _optimize_cell_set(points, cells, args):
+    # module-level so that it can be pickled into worker processes
+    return optimize_points_cells(
+        points,
+        cells,
+        args.method,
+        args.tolerance,
+        args.max_num_steps,
+        omega=args.omega,
+        verbose=not args.quiet,
+        step_filename_format=args.step_filename_format,
+    )
+
+
 def main(argv=None):
     parser = _get_parser()
     args = parser.parse_args(argv)
@@ -150,30 +168,41 @@ def main(argv=None):
     mesh.cells = [meshio.CellBlock("triangle", mesh.get_cells_type("triangle"))]
     prune(mesh)
 
+    # get_cells_type concatenates the matching blocks on every call; fetch the pruned
+    # triangles once and reuse them.
+    cells = mesh.get_cells_type("triangle")
+
     if args.subdomain_field_name:
         field = mesh.cell_data["triangle"][args.subdomain_field_name]
         subdomain_idx = np.unique(field)
         cell_sets = [idx == field for idx in subdomain_idx]
     else:
-        cell_sets = [np.ones(mesh.get_cells_type("triangle").shape[0], dtype=bool)]
-
-    cells = mesh.get_cells_type("triangle")
-
-    for cell_idx in cell_sets:
-        X, cls = optimize_points_cells(
-            mesh.points,
-            cells[cell_idx],
-            args.method,
-            args.tolerance,
-            args.max_num_steps,
-            omega=args.omega,
-            verbose=~args.quiet,
-            step_filename_format=args.step_filename_format,
-        )
-
+        cell_sets = [np.ones(cells.shape[0], dtype=bool)]
+
+    # Every cell set is smoothed independently, starting from the input points. The
+    # interface points between subdomains are boundary points of each submesh and are
+    # hence never moved, which makes the subdomains embarrassingly parallel; merging
+    # a result amounts to collecting its moved points.
+    X = mesh.points.copy()
+
+    def merge(result, cell_idx):
+        X_sub, cls = result
+        moved = np.any(X_sub != mesh.points, axis=1)
+        X[moved] = X_sub[moved]
         cells[cell_idx] = cls
 
-    q = meshplex.MeshTri(X, cls).q_radius_ratio
+    if len(cell_sets) == 1:
+        merge(_optimize_cell_set(mesh.points, cells[cell_sets[0]], args), cell_sets[0])
+    else:
+        with ProcessPoolExecutor() as executor:
+            futures = [
+                executor.submit(_optimize_cell_set, mesh.points, cells[cell_idx], args)
+                for cell_idx in cell_sets
+            ]
+            for cell_idx, future in zip(cell_sets, futures):
+                merge(future.result(), cell_idx)
+
+    q = meshplex.MeshTri(X, cells).q_radius_ratio
     meshio.write_points_cells(
         args.output_file,
         X,
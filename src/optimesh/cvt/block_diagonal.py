@@ -15,7 +15,7 @@ def get_new_points(mesh: meshplex.Mesh) -> np.ndarray:
     # to cells at or near the boundary.
     mask = np.any(mesh.ce_ratios < -0.5, axis=0)
 
-    X = mesh.points.copy()
+    X = mesh.points
     # Collect the diagonal blocks.
     diagonal_blocks = np.zeros((X.shape[0], X.shape[1], X.shape[1]))
 
@@ -81,6 +81,5 @@ def get_new_points(mesh: meshplex.Mesh) -> np.ndarray:
         diagonal_blocks[idx, k, k] = 1.0
     rhs[idx] = 0.0
 
-    X += np.linalg.solve(diagonal_blocks, rhs)
-
-    return X
+    # No copy of the points needed: the addition allocates the result.
+    return X + np.linalg.solve(diagonal_blocks, rhs)
@@ -6,10 +6,8 @@ from ._helpers import jac_uniform
 
 
 def get_new_points(mesh: meshplex.Mesh) -> np.ndarray:
-    # TODO need copy?
-    x = mesh.points.copy()
-    x += update(mesh)
-    return x
+    # No copy needed: the addition allocates the result, mesh.points is untouched.
+    return mesh.points + update(mesh)
 
 
 def update(mesh: meshplex.Mesh):
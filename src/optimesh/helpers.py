@@ -1,20 +1,21 @@
-import npx
 import numpy as np
+import scipy.sparse
 import termplotlib as tpl
 
 
+# The histogram bins never depend on the mesh, so compute the edges only once.
+_angle_bin_edges = np.linspace(0.0, 180.0, num=73, endpoint=True)
+_quality_bin_edges = np.linspace(0.0, 1.0, num=41, endpoint=True)
+
+
 def print_stats(mesh, extra_cols=None):
     extra_cols = [] if extra_cols is None else extra_cols
 
     angles = mesh.angles / np.pi * 180
-    angles_hist, angles_bin_edges = np.histogram(
-        angles, bins=np.linspace(0.0, 180.0, num=73, endpoint=True)
-    )
+    angles_hist, angles_bin_edges = np.histogram(angles, bins=_angle_bin_edges)
 
     q = mesh.q_radius_ratio
-    q_hist, q_bin_edges = np.histogram(
-        q, bins=np.linspace(0.0, 1.0, num=41, endpoint=True)
-    )
+    q_hist, q_bin_edges = np.histogram(q, bins=_quality_bin_edges)
 
     grid = tpl.subplot_grid(
         (1, 4 + len(extra_cols)), column_widths=None, border_style=None
@@ -68,11 +69,7 @@ def get_new_points_averaged(mesh, reference_points, weights=None):
     this method returns the (weighted) average of the reference points of all adjacent
     cells. The weights could for example be the volumes of the cells.
     """
-    if weights is None:
-        scaled_rp = reference_points.T
-    else:
-        scaled_rp = reference_points.T * weights
-
+    # old way:
     # new_points = np.zeros(mesh.points.shape)
     # for i in mesh.cells("points").T:
     #     np.add.at(new_points, i, scaled_rp)
@@ -80,17 +77,23 @@ def get_new_points_averaged(mesh, reference_points, weights=None):
     # for i in mesh.cells("points").T:
     #     np.add.at(omega, i, mesh.cell_volumes)
 
-    new_points = np.zeros(mesh.points.shape)
-
-    n = new_points.shape[0]
-    for i in mesh.cells("points").T:
-        new_points += npx.sum_at(scaled_rp.T, i, new_points.shape[0])
-
-    if weights is None:
-        omega = np.bincount(mesh.cells("points").reshape(-1), minlength=n)
-    else:
-        omega = np.zeros(n)
-        for i in mesh.cells("points").T:
-            omega += np.bincount(i, weights, minlength=n)
+    cells = mesh.cells("points")
+    n = mesh.points.shape[0]
+    num_cells, num_corners = cells.shape
+
+    # Build the point-cell incidence matrix with the weights as entries. The averages
+    # for all points are then two sparse matrix-vector products. (The matrix has to be
+    # rebuilt in every call: the weights are typically cell volumes which change with
+    # every smoothing step, and edge flips alter the sparsity structure.)
+    w = np.ones(num_cells) if weights is None else weights
+    incidence = scipy.sparse.csr_matrix(
+        (
+            np.repeat(w, num_corners),
+            (cells.reshape(-1), np.repeat(np.arange(num_cells), num_corners)),
+        ),
+        shape=(n, num_cells),
+    )
 
+    new_points = incidence @ reference_points
+    omega = incidence @ np.ones(num_cells)
     return (new_points.T / omega).T
@@ -17,13 +17,19 @@ def get_new_points(mesh) -> np.ndarray:
     n = mesh.points.shape[0]
     idx = mesh.edges["points"]
     num_neighbors = np.bincount(idx.reshape(-1), minlength=n)
+    i0 = idx[:, 0]
+    i1 = idx[:, 1]
 
-    new_points = np.zeros(mesh.points.shape)
-    vals = mesh.points[idx[:, 1]].T
-    new_points += np.array([np.bincount(idx[:, 0], val, minlength=n) for val in vals]).T
-    vals = mesh.points[idx[:, 0]].T
-    new_points += np.array([np.bincount(idx[:, 1], val, minlength=n) for val in vals]).T
-    new_points /= num_neighbors[:, None]
+    # Work coordinate-major: one contiguous row per coordinate so that each gather and
+    # bincount below streams over contiguous memory instead of strided columns.
+    pts = np.ascontiguousarray(mesh.points.T)
+
+    new_points = np.empty(pts.shape)
+    for d, coord in enumerate(pts):
+        new_points[d] = np.bincount(i0, coord[i1], minlength=n)
+        new_points[d] += np.bincount(i1, coord[i0], minlength=n)
+    new_points /= num_neighbors
+    new_points = new_points.T
 
     # reset boundary points
     idx = mesh.is_boundary_point
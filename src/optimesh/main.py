@@ -69,6 +69,26 @@ def optimize_points_cells(X: ArrayLike, cells: ArrayLike, method: str, *args, **
     return mesh.points, mesh.cells("points")
 
 
+def _project_onto_surface(implicit_surface, points, tol):
+    """Move the points onto the zero level set of implicit_surface.f, in place."""
+    fval = implicit_surface.f(points.T)
+    outside = np.abs(fval) > tol
+    # Newton iteration, restricted to the points that haven't converged yet; most
+    # points are on the surface after one or two steps, so later sweeps only touch a
+    # shrinking subset.
+    while np.any(outside):
+        idx = np.flatnonzero(outside)
+        grad = implicit_surface.grad(points[idx].T)
+        grad_dot_grad = np.einsum("ij,ij->j", grad, grad)
+        # The step is chosen in the direction of the gradient with a step size such
+        # that, if the function was linear, the boundary (fval=0) would be hit in one
+        # step.
+        points[idx] -= (grad * (fval[idx] / grad_dot_grad)).T
+        # compute new value
+        fval[idx] = implicit_surface.f(points[idx].T)
+        outside[idx] = np.abs(fval[idx]) > tol
+
+
 def _optimize(
     get_new_points: Callable,
     mesh: meshplex.MeshTri,
@@ -100,25 +120,40 @@ def _optimize(
         callback(k, mesh)
 
     # mesh.write("out0.vtk")
-    if hasattr(mesh, "flip_until_delaunay"):
+    can_flip = hasattr(mesh, "flip_until_delaunay")
+    if can_flip:
         mesh.flip_until_delaunay()
     # mesh.write("out1.vtk")
 
+    # The number of points never changes, so the step-limit buffer can be allocated
+    # once and refilled in every iteration.
+    max_step = np.empty(mesh.points.shape[0])
+
     while True:
         k += 1
         new_points = get_new_points(mesh)
 
+        # All geometric quantities (cell_volumes, cell_inradius, circumcenters, ...)
+        # are memoized by meshplex and only recomputed once the points are reassigned
+        # at the end of the iteration, so repeated access within one iteration is
+        # cheap. Keep the points themselves in a local for the same reason.
+        points = mesh.points
+
         # Move boundary points to the domain boundary, if given. If not just move the
         # points back to their original positions.
         idx = mesh.is_boundary_point
         if boundary_step is None:
             # Reset boundary points to their original positions.
-            new_points[idx] = mesh.points[idx]
+            new_points[idx] = points[idx]
         else:
             # Move all boundary points back to the boundary.
             new_points[idx] = boundary_step(new_points[idx].T).T
 
-        diff = omega * (new_points - mesh.points)
+        diff = new_points - points
+        if omega != 1.0:
+            # Only apply the relaxation (an extra full pass over the array) if there
+            # actually is any; omega=1.0 is the default.
+            diff *= omega
 
         # Some methods are stable (CPT), others can break down if the mesh isn't very
         # smooth. A break-down manifests, for example, in a step size that lets cells
@@ -127,54 +162,54 @@ def _optimize(
         # incircle radius of all adjacent cells. This makes sure that triangles cannot
         # "flip".
         # <https://stackoverflow.com/a/57261082/353337>
-        max_step = np.full(mesh.points.shape[0], np.inf)
-        np.minimum.at(
-            max_step,
-            mesh.cells("points").reshape(-1),
-            np.repeat(mesh.cell_inradius, mesh.cells("points").shape[1]),
+        # np.minimum.at would be the obvious scatter-min here, but ufunc.at takes an
+        # unbuffered Python-level path and is much slower than sorting the indices and
+        # reducing each group with np.minimum.reduceat.
+        cells = mesh.cells("points")
+        flat_idx = cells.reshape(-1)
+        order = np.argsort(flat_idx, kind="stable")
+        idx_sorted = flat_idx[order]
+        starts = np.concatenate([[0], np.flatnonzero(np.diff(idx_sorted)) + 1])
+        max_step.fill(np.inf)
+        max_step[idx_sorted[starts]] = np.minimum.reduceat(
+            np.repeat(mesh.cell_inradius, cells.shape[1])[order], starts
         )
         max_step *= 0.5
         #
-        step_lengths = np.sqrt(
-            np.einsum(
-                "ij,ij->i",
-                diff.reshape(diff.shape[0], -1),
-                diff.reshape(diff.shape[0], -1),
-            )
-        )
+        # Plain multiply-sum; for the small fixed row dimension the einsum dispatch
+        # overhead isn't worth it.
+        d = diff.reshape(diff.shape[0], -1)
+        step_lengths = np.sqrt((d * d).sum(axis=1))
 
         # alpha = np.min(max_step / step_lengths)
         # alpha = np.min([alpha, 1.0])
         # diff *= alpha
-        idx = step_lengths > max_step
-        diff[idx] = (diff[idx].T * (max_step[idx] / step_lengths[idx])).T
+        #
+        # Branchless clamp: scale is 1.0 wherever the step is short enough, so this is
+        # a single streaming pass over diff without materializing a mask.
+        scale = np.minimum(max_step, step_lengths) / np.where(
+            step_lengths > 0.0, step_lengths, 1.0
+        )
+        diff = (diff.T * scale).T
 
-        new_points = mesh.points + diff
+        new_points = points + diff
 
         # project all points back to the surface, if any
         if implicit_surface is not None:
-            fval = implicit_surface.f(new_points.T)
-            while np.any(np.abs(fval) > implicit_surface_tol):
-                grad = implicit_surface.grad(new_points.T)
-                grad_dot_grad = np.einsum("ij,ij->j", grad, grad)
-                # The step is chosen in the direction of the gradient with a step size
-                # such that, if the function was linear, the boundary (fval=0) would be
-                # hit in one step.
-                new_points -= (grad * (fval / grad_dot_grad)).T
-                # compute new value
-                fval = implicit_surface.f(new_points.T)
+            _project_onto_surface(implicit_surface, new_points, implicit_surface_tol)
 
         mesh.points = new_points
-        if hasattr(mesh, "flip_until_delaunay"):
+        if can_flip:
             mesh.flip_until_delaunay()
         # mesh.show(control_volume_centroid_color="C1")
         # mesh.show()
 
-        # Abort the loop if the update was small
-        diff_norm_2 = np.einsum(
-            "ij,ij->i", diff.reshape(diff.shape[0], -1), diff.reshape(diff.shape[0], -1)
-        )
-        is_final = np.all(diff_norm_2 < tol ** 2) or k >= max_num_steps
+        # Abort the loop if the update was small. The clamped step lengths are already
+        # known from the step-size restriction above, so there's no need for another
+        # full reduction pass over diff; one max reduction and a scalar comparison
+        # settle the convergence check.
+        max_move = np.max(step_lengths * scale)
+        is_final = max_move < tol or k >= max_num_steps
 
         if is_final or step_filename_format:
             if is_final:
@@ -200,4 +235,4 @@ def _optimize(
         if is_final:
             break
 
-    return k, np.max(np.sqrt(diff_norm_2))
+    return k, max_move
@@ -11,9 +11,9 @@ def get_new_points(mesh):
     # Get circumcenters everywhere except at cells adjacent to the boundary;
     # barycenters there.
     cc = mesh.cell_circumcenters
-    bc = mesh.cell_barycenters
     # Find all cells with a boundary edge
-    cc[mesh.is_boundary_cell] = bc[mesh.is_boundary_cell]
+    is_boundary_cell = mesh.is_boundary_cell
+    cc[is_boundary_cell] = mesh.cell_barycenters[is_boundary_cell]
     X = get_new_points_averaged(mesh, cc, mesh.cell_volumes)
     return X
 
@@ -7,10 +7,49 @@ Comput. Methods Appl. Mech. Engrg. 200 (2011) 967–984,
 <https://doi.org/10.1016/j.cma.2010.11.007>.
 """
 import numpy as np
-import quadpy
 
 from ..helpers import print_stats
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+
+
+if njit is not None:
+
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _energy_uniform_fused(points, cells):
+        """Single fused pass over the cells for the uniform-density energy.
+
+        Both energy terms have closed forms on a triangle T = (v0, v1, v2):
+
+            1/3 sum_i ||x_i||^2 |omega_i| = sum_T |T|/3 (|v0|^2 + |v1|^2 + |v2|^2),
+            int_T ||x||^2 = |T|/6 (|v0|^2 + |v1|^2 + |v2|^2 + v0.v1 + v1.v2 + v2.v0).
+
+        Their difference collapses to |T|/12 times the sum of the squared edge
+        lengths, so no quadrature scheme and no temporaries are needed.
+        """
+        total = 0.0
+        for k in prange(cells.shape[0]):
+            x0 = points[cells[k, 0], 0]
+            y0 = points[cells[k, 0], 1]
+            x1 = points[cells[k, 1], 0]
+            y1 = points[cells[k, 1], 1]
+            x2 = points[cells[k, 2], 0]
+            y2 = points[cells[k, 2], 1]
+            area = 0.5 * abs((x1 - x0) * (y2 - y0) - (y1 - y0) * (x2 - x0))
+            e2 = (
+                (x1 - x0) ** 2
+                + (y1 - y0) ** 2
+                + (x2 - x1) ** 2
+                + (y2 - y1) ** 2
+                + (x0 - x2) ** 2
+                + (y0 - y2) ** 2
+            )
+            total += area / 12.0 * e2
+        return total
+
 
 def _energy(mesh, uniform_density=False):
     """The mesh energy is defined as
@@ -22,6 +61,12 @@ def _energy(mesh, uniform_density=False):
     # E = 1/(d+1) sum_i ||x_i||^2 |omega_i| - int_Omega_i ||x||^2
     dim = mesh.cells("points").shape[1] - 1
 
+    if uniform_density and dim == 2 and njit is not None:
+        # hot path; called for every function evaluation of the minimizer
+        return _energy_uniform_fused(
+            np.ascontiguousarray(mesh.points[:, :2]), mesh.cells("points")
+        )
+
     n = mesh.points.shape[0]
     star_volume = np.zeros(n)
     for i in range(3):
@@ -39,13 +84,19 @@ def _energy(mesh, uniform_density=False):
     x2 = np.einsum("ij,ij->i", mesh.points, mesh.points)
     out = 1 / (dim + 1) * np.dot(star_volume, x2)
 
-    # could be cached
     assert dim == 2
     x = mesh.points[:, :2]
-    triangles = np.moveaxis(x[mesh.cells("points")], 0, 1)
-    # Get a scheme with order 2
-    scheme = quadpy.t2.get_good_scheme(2)
-    val = scheme.integrate(lambda x: x[0] ** 2 + x[1] ** 2, triangles)
+    v = x[mesh.cells("points")]
+    # The integrand is a quadratic polynomial, so no quadrature scheme is needed:
+    #
+    #   int_T ||x||^2 = |T|/6 (|v0|^2 + |v1|^2 + |v2|^2 + v0.v1 + v1.v2 + v2.v0).
+    #
+    # With the Gram matrices G_ij = v_i.v_j, the parenthesis is
+    # (trace(G) + sum(G)) / 2.
+    gram = np.einsum("ijk,ilk->ijl", v, v)
+    val = (
+        mesh.cell_volumes / 12 * (np.einsum("ijj->i", gram) + np.sum(gram, axis=(1, 2)))
+    )
     if uniform_density:
         val = np.sum(val)
     else:
@@ -118,13 +169,17 @@ def nonlinear_optimization(
     def jac(x):
         mesh.set_points(x.reshape(-1, X.shape[1]), mesh.is_interior_point)
 
-        grad = np.zeros(mesh.points.shape)
-        n = grad.shape[0]
+        n = mesh.points.shape[0]
+        cells = mesh.cells("points")
         cc = mesh.cell_circumcenters
-        for mcn in mesh.cells("points").T:
-            vals = (mesh.points[mcn] - cc).T * mesh.cell_volumes
-            # np.add.at(grad, mcn, vals)
-            grad += np.array([np.bincount(mcn, val, minlength=n) for val in vals]).T
+        # contributions of all three corners at once, shape (num_cells, 3, dim)
+        vals = (mesh.points[cells] - cc[:, None]) * mesh.cell_volumes[:, None, None]
+        flat_vals = vals.reshape(-1, vals.shape[-1])
+        # np.add.at(grad, cells.reshape(-1), flat_vals)
+        flat_idx = cells.reshape(-1)
+        grad = np.array(
+            [np.bincount(flat_idx, val, minlength=n) for val in flat_vals.T]
+        ).T
         gdim = 2
         grad *= 2 / (gdim + 1)
         return grad[mesh.is_interior_point].flatten()
@@ -171,7 +226,7 @@ def nonlinear_optimization(
 
     info = (
         f"{out.nit} steps,"
-        + "Optimal Delaunay Tessellation (ODT), uniform density, BFGS variant"
+        + f"Optimal Delaunay Tessellation (ODT), uniform density, {method} variant"
     )
     if verbose:
         print(f"\nFinal ({info})")
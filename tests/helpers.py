@@ -40,18 +40,22 @@ def run(mesh, volume, convol_norms, ce_ratio_norms, cellvol_norms, tol=1.0e-12):
     assert near_equal(convol_norms, [norm2, norm_inf], tol)
 
 
+def circle_boundary_step(x, x0=(0.0, 0.0), R=1.0):
+    """Project the points x (shape (2, n)) onto the circle around x0 with radius R."""
+    y = (x.T - x0).T
+    r = np.sqrt(np.einsum("ij,ij->j", y, y))
+    return ((y / r * R).T + x0).T
+
+
 def assert_norm_equality(X, ref, tol):
-    xflat = X.flatten()
+    # ravel instead of flatten: a view suffices here, no need to copy
+    xflat = X.ravel()
     ref = np.asarray(ref)
-    val = np.array(
-        [
-            np.linalg.norm(xflat, ord=1),
-            np.linalg.norm(xflat, ord=2),
-            np.linalg.norm(xflat, ord=np.inf),
-        ]
-    )
+    # All three norms derive from one pass over the absolute values.
+    absx = np.abs(xflat)
+    val = np.array([np.sum(absx), np.sqrt(np.dot(absx, absx)), np.max(absx)])
     dif = np.abs(val - ref) / ref
-    assert np.all(np.abs(val - ref) < tol * ref), (
+    assert np.allclose(val, ref, rtol=tol, atol=0.0), (
         "Norms don't coincide.\n"
         + f"Expected:  [{ref[0]:.16e}, {ref[1]:.16e}, {ref[2]:.16e}]\n"
         + f"Computed:  [{val[0]:.16e}, {val[1]:.16e}, {val[2]:.16e}]\n\n"
@@ -1,4 +1,5 @@
 import pathlib
+from functools import lru_cache
 
 import meshio
 import meshplex
@@ -7,13 +8,19 @@ from scipy.spatial import Delaunay
 
 this_dir = pathlib.Path(__file__).resolve().parent
 
+# The deterministic meshes below are memoized: several test modules request the same
+# fixture (pacman in particular, which involves reading a file), and the tests
+# deepcopy before mutating anything.
 
+
+@lru_cache(None)
 def simple_line():
     X = np.array([0.0, 0.1, 0.4, 1.0])
     cells = np.array([[0, 1], [1, 2], [2, 3]])
     return meshplex.Mesh(X, cells)
 
 
+@lru_cache(None)
 def simple0():
     #
     #  3___________2
@@ -38,6 +45,7 @@ def simple0():
     return meshplex.MeshTri(X, cells)
 
 
+@lru_cache(None)
 def simple1():
     #
     #  3___________2
@@ -54,6 +62,7 @@ def simple1():
     return meshplex.MeshTri(X, cells)
 
 
+@lru_cache(None)
 def simple2():
     #
     #  3___________2
@@ -72,6 +81,7 @@ def simple2():
     return meshplex.MeshTri(X, cells)
 
 
+@lru_cache(None)
 def simple3():
     #
     #  5___________4___________3
@@ -110,6 +120,7 @@ def simple3():
     return meshplex.MeshTri(X, cells)
 
 
+@lru_cache(None)
 def pacman():
     mesh = meshio.read(this_dir / "meshes" / "pacman.vtk")
     return meshplex.MeshTri(mesh.points[:, :2], mesh.get_cells_type("triangle"))
@@ -23,6 +23,7 @@ this_dir = pathlib.Path(__file__).resolve().parent
         #
         ["--method", "odt-fixed-point"],
         ["--method", "odt-bfgs"],
+        ["--method", "odt-l-bfgs-b"],
     ],
 )
 def test_cli(options):
@@ -7,7 +7,7 @@ import optimesh
 from optimesh.cpt.quasi_newton import _jac_uniform
 
 from . import meshes
-from .helpers import assert_norm_equality
+from .helpers import assert_norm_equality, circle_boundary_step
 
 simple0 = meshes.simple0()
 simple1 = meshes.simple1()
@@ -27,14 +27,15 @@ def _energy_uniform_per_point(X, cells):
     """
     mesh = MeshTri(X, cells)
 
+    # Get a scheme of order 2
+    scheme = quadpy.t2.get_good_scheme(2)
+
     star_integrals = np.zeros(mesh.points.shape[0])
     # Python loop over the cells... slow!
     for cell in mesh.cells("points"):
         for idx in cell:
             xi = mesh.points[idx]
             tri = mesh.points[cell]
-            # Get a scheme of order 2
-            scheme = quadpy.t2.get_good_scheme(2)
             val = scheme.integrate(
                 lambda x: np.einsum("ij,ij->i", x.T - xi, x.T - xi), tri
             )
@@ -80,8 +81,11 @@ def test_simple1_jac():
 @pytest.mark.parametrize(
     "mesh, ref",
     [
-        (simple1, [0.96, 0.3262279745178587, 29.0 / 225.0]),
-        (pacman, [12.35078985438217, 0.5420691555930099, 0.10101179397867549]),
+        (simple1, np.array([0.96, 0.3262279745178587, 29.0 / 225.0])),
+        (
+            pacman,
+            np.array([12.35078985438217, 0.5420691555930099, 0.10101179397867549]),
+        ),
     ],
 )
 def test_jac(mesh, ref):
@@ -93,17 +97,33 @@ def test_jac(mesh, ref):
 @pytest.mark.parametrize(
     "method, mesh, ref",
     [
-        ("cpt (fixed-point)", simple_line, [2.0, 1.2472191289241747e00, 1.0]),
+        ("cpt (fixed-point)", simple_line, np.array([2.0, 1.2472191289241747e00, 1.0])),
         #
-        ("cpt (fixed-point)", simple1, [5.0, 2.1213203435596424, 1.0]),
-        ("cpt (fixed-point)", simple2, [7.390123456790124, 2.804687217072868, 1.7]),
-        ("cpt (fixed-point)", simple3, [12.0, 3.9765648779799356, 2.0]),
-        ("cpt (fixed-point)", pacman, [1901.5304112865315, 74.62452940437535, 5.0]),
+        ("cpt (fixed-point)", simple1, np.array([5.0, 2.1213203435596424, 1.0])),
+        (
+            "cpt (fixed-point)",
+            simple2,
+            np.array([7.390123456790124, 2.804687217072868, 1.7]),
+        ),
+        ("cpt (fixed-point)", simple3, np.array([12.0, 3.9765648779799356, 2.0])),
+        (
+            "cpt (fixed-point)",
+            pacman,
+            np.array([1901.5304112865315, 74.62452940437535, 5.0]),
+        ),
         #
-        ("cpt (quasi-newton)", simple1, [5.0, 2.1213203435596424, 1.0]),
-        ("cpt (quasi-newton)", simple2, [7.390123456790124, 2.804687217072868, 1.7]),
-        ("cpt (quasi-newton)", simple3, [12.0, 3.976564877979913, 2.0]),
-        ("cpt (quasi-newton)", pacman, [1900.910794007578, 74.58866209782154, 5.0]),
+        ("cpt (quasi-newton)", simple1, np.array([5.0, 2.1213203435596424, 1.0])),
+        (
+            "cpt (quasi-newton)",
+            simple2,
+            np.array([7.390123456790124, 2.804687217072868, 1.7]),
+        ),
+        ("cpt (quasi-newton)", simple3, np.array([12.0, 3.976564877979913, 2.0])),
+        (
+            "cpt (quasi-newton)",
+            pacman,
+            np.array([1900.910794007578, 74.58866209782154, 5.0]),
+        ),
     ],
 )
 def test_methods(method, mesh, ref):
@@ -124,8 +144,8 @@ def test_methods(method, mesh, ref):
 @pytest.mark.parametrize(
     "mesh, ref",
     [
-        (simple1, [5.0, 2.1213203435596424, 1.0]),
-        (pacman, [1864.2406342781524, 73.19722600427883, 5.0]),
+        (simple1, np.array([5.0, 2.1213203435596424, 1.0])),
+        (pacman, np.array([1864.2406342781524, 73.19722600427883, 5.0])),
     ],
 )
 def test_density_preserving(mesh, ref):
@@ -135,17 +155,9 @@ def test_density_preserving(mesh, ref):
 
 
 def test_circle():
-    def boundary_step(x):
-        x0 = [0.0, 0.0]
-        R = 1.0
-        # simply project onto the circle
-        y = (x.T - x0).T
-        r = np.sqrt(np.einsum("ij,ij->j", y, y))
-        return ((y / r * R).T + x0).T
-
     X, cells = meshes.circle_random2(150, 1.0)
     X, cells = optimesh.optimize_points_cells(
-        X, cells, "cpt (fixed-point)", 1.0e-3, 100, boundary_step=boundary_step
+        X, cells, "cpt (fixed-point)", 1.0e-3, 100, boundary_step=circle_boundary_step
     )
 
     mesh = MeshTri(X, cells)
@@ -1,3 +1,6 @@
+import copy
+
+import numpy as np
 import pytest
 
 import optimesh
@@ -9,10 +12,11 @@ from .meshes import pacman, simple1
 @pytest.mark.parametrize(
     "mesh, ref",
     [
-        (simple1(), [5.0, 2.1213203435596424, 1.0]),
-        (pacman(), [1919.3310978354305, 75.03937100433645, 5.0]),
+        (simple1(), np.array([5.0, 2.1213203435596424, 1.0])),
+        (pacman(), np.array([1919.3310978354305, 75.03937100433645, 5.0])),
     ],
 )
 def test_fixed_point(mesh, ref):
-    optimesh.optimize(mesh, "laplace", 0.0, 10)
-    assert_norm_equality(mesh.points, ref, 1.0e-12)
+    m = copy.deepcopy(mesh)
+    optimesh.optimize(m, "laplace", 0.0, 10)
+    assert_norm_equality(m.points, ref, 1.0e-12)
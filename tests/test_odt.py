@@ -7,7 +7,7 @@ from meshplex import MeshTri
 import optimesh
 
 from . import meshes
-from .helpers import assert_norm_equality
+from .helpers import assert_norm_equality, circle_boundary_step
 
 simple_line = meshes.simple_line()
 simple0 = meshes.simple0()
@@ -20,12 +20,12 @@ pacman = meshes.pacman()
 @pytest.mark.parametrize(
     "mesh, ref",
     [
-        (simple_line, [1.9987021872424522e00, 1.2467122478953498e00, 1.0]),
+        (simple_line, np.array([1.9987021872424522e00, 1.2467122478953498e00, 1.0])),
         #
-        (simple1, [5.0, 2.1213203435596424, 1.0]),
-        (simple2, [7.390123456790124, 2.804687217072868, 1.7]),
-        (simple3, [12.00095727371816, 3.9768056113618786, 2.0]),
-        (pacman, [1913.7750600561587, 75.0497156713882, 5.0]),
+        (simple1, np.array([5.0, 2.1213203435596424, 1.0])),
+        (simple2, np.array([7.390123456790124, 2.804687217072868, 1.7])),
+        (simple3, np.array([12.00095727371816, 3.9768056113618786, 2.0])),
+        (pacman, np.array([1913.7750600561587, 75.0497156713882, 5.0])),
     ],
 )
 def test_fixed_point(mesh, ref):
@@ -37,9 +37,9 @@ def test_fixed_point(mesh, ref):
 @pytest.mark.parametrize(
     "mesh, ref",
     [
-        (simple1, [5.0, 2.1213203435596424, 1.0]),
-        (simple2, [1991.0 / 270.0, 2.8007812940925643, 1.7]),
-        (simple3, [12.000001546277293, 3.9828845062967257, 2.0]),
+        (simple1, np.array([5.0, 2.1213203435596424, 1.0])),
+        (simple2, np.array([1991.0 / 270.0, 2.8007812940925643, 1.7])),
+        (simple3, np.array([12.000001546277293, 3.9828845062967257, 2.0])),
         # (pacman, [1919.2497615803882, 75.226990639805, 5.0]),
     ],
 )
@@ -50,20 +50,12 @@ def test_nonlinear_optimization(mesh, ref):
 
 
 def test_circle():
-    def boundary_step(x):
-        x0 = [0.0, 0.0]
-        R = 1.0
-        # simply project onto the circle
-        y = (x.T - x0).T
-        r = np.sqrt(np.einsum("ij,ij->j", y, y))
-        return ((y / r * R).T + x0).T
-
     # ODT can't handle the random circle; some cells too flat near the boundary lead to
     # a breakdown.
     # X, cells = circle_random2(150, 1.0, seed=1)
     X, cells = meshes.circle_gmsh2()
     X, cells = optimesh.optimize_points_cells(
-        X, cells, "ODT (fixed-point)", 1.0e-3, 100, boundary_step=boundary_step
+        X, cells, "ODT (fixed-point)", 1.0e-3, 100, boundary_step=circle_boundary_step
     )
 
     mesh = MeshTri(X, cells)